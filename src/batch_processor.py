@@ -5,18 +5,26 @@ without hallucination, while keeping Gemini's native PDF vision for
 strikethrough detection.
 """
 
+import asyncio
+import bisect
+import functools
 import io
 import logging
+import random
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
 
-from pypdf import PdfReader, PdfWriter
-
-from src.gemini_client import FLASH_MODEL, GeminiClient
+from src.gemini_client import FLASH_MODEL, CircuitOpenError, GeminiClient, run_async
 from src.prompts import CLAUSE_EXTRACTION_PROMPT
 
+# pypdf is imported where first needed so that the CLI can build a BatchConfig
+# (and answer --help) without paying for it.
+if TYPE_CHECKING:
+    from pypdf import PdfReader
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,8 +38,10 @@ class BatchConfig:
     overlap: int = 2
     parallel: bool = False
     max_workers: int = 3
+    launch_stagger: float = 0.05  # Seconds between parallel batch launches
     max_retries: int = 3
     retry_delay: float = 2.0  # Base delay for exponential backoff
+    max_retry_delay: float = 60.0  # Cap on a single backoff delay
     model: str = FLASH_MODEL  # Default to Flash for speed in batch processing
 
 
@@ -46,6 +56,23 @@ class BatchResult:
     error: str | None = None
 
 
+@functools.lru_cache(maxsize=256)
+def _batch_prompt(start_page: int, end_page: int) -> str:
+    """Return the extraction prompt for a page range.
+
+    The multi-KB base prompt is concatenated once per range, and repeated
+    documents get the identical string object back, which keeps the client's
+    per-prompt caches hitting.
+    """
+    page_context = (
+        f"\n\n**Page Context:** This is a subset of a larger document. "
+        f"The pages in this PDF correspond to pages {start_page}-{end_page} "
+        f"of the original document. Please report page numbers as they appear "
+        f"in the original document (starting from page {start_page})."
+    )
+    return CLAUSE_EXTRACTION_PROMPT + page_context
+
+
 class BatchProcessor:
     """Process large PDFs in batches for reliable clause extraction."""
 
@@ -58,10 +85,53 @@ class BatchProcessor:
         """
         self.config = config
         self.client = client or GeminiClient(model=config.model)
+        # One parsed reader per source PDF, shared by all batches. pypdf
+        # readers are not thread-safe, so page extraction holds the lock.
+        self._readers: dict[str, tuple[IO[bytes], PdfReader]] = {}
+        self._reader_lock = threading.Lock()
+        # Batches that failed in the last process()/process_async() run; the
+        # merged result then covers only part of the requested pages
+        self.failed_batches: list[BatchResult] = []
 
     def process(self, pdf_path: str) -> dict[str, Any]:
         """Process a PDF file with batching.
 
+        Parallel batches run in a private event loop, so with parallel set
+        this must not be called while an event loop is running; await
+        process_async there instead.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Dictionary with merged clauses: {"clauses": [...]}
+
+        Raises:
+            RuntimeError: If all batches fail, or if parallel batches are
+                requested from a running event loop
+        """
+        logger.info(f"Starting batch processing of {pdf_path}")
+
+        try:
+            batches = self._plan_batches(pdf_path)
+
+            # Process batches
+            if self.config.parallel and len(batches) > 1:
+                results = self._process_parallel(pdf_path, batches)
+            else:
+                results = self._process_sequential(pdf_path, batches)
+
+            return self._combine_results(results, batches)
+        finally:
+            self.close()
+
+    async def process_async(self, pdf_path: str) -> dict[str, Any]:
+        """Process a PDF file with batching on the running event loop.
+
+        Batches are dispatched as coroutines through the async Gemini client,
+        up to max_workers at a time when parallel is set (one at a time
+        otherwise), so callers already inside an event loop do not block it.
+
         Args:
             pdf_path: Path to the PDF file
 
@@ -73,10 +143,32 @@ class BatchProcessor:
         """
         logger.info(f"Starting batch processing of {pdf_path}")
 
+        try:
+            batches = self._plan_batches(pdf_path)
+            results = await self._process_async(pdf_path, batches)
+            return self._combine_results(results, batches)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the source PDFs held open by the reader cache."""
+        with self._reader_lock:
+            for pdf_file, _ in self._readers.values():
+                pdf_file.close()
+            self._readers.clear()
+
+    def _plan_batches(self, pdf_path: str) -> list[tuple[int, int]]:
+        """Resolve the configured page range and split it into batches.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            List of (batch_start, batch_end) tuples (1-indexed)
+        """
         # Read the PDF to get total pages
-        with open(pdf_path, "rb") as f:
-            reader = PdfReader(f)
-            total_pages = len(reader.pages)
+        with self._reader_lock:
+            total_pages = len(self._get_reader(pdf_path).pages)
 
         logger.info(f"PDF has {total_pages} pages")
 
@@ -99,15 +191,26 @@ class BatchProcessor:
         # Calculate batches
         batches = self._calculate_batches(start_page, end_page)
         logger.info(f"Calculated {len(batches)} batches: {batches}")
+        return batches
 
-        # Process batches
-        if self.config.parallel and len(batches) > 1:
-            results = self._process_parallel(pdf_path, batches)
-        else:
-            results = self._process_sequential(pdf_path, batches)
+    def _combine_results(
+        self, results: list[BatchResult], batches: list[tuple[int, int]]
+    ) -> dict[str, Any]:
+        """Report failed batches and merge the successful ones.
 
+        Args:
+            results: List of BatchResult objects in batch order
+            batches: Original batch definitions for overlap detection
+
+        Returns:
+            Dictionary with merged clauses: {"clauses": [...]}
+
+        Raises:
+            RuntimeError: If all batches fail
+        """
         # Check for complete failure
         successful_results = [r for r in results if r.success]
+        self.failed_batches = [r for r in results if not r.success]
         if not successful_results:
             failed_ranges = [f"{r.page_range[0]}-{r.page_range[1]}" for r in results]
             raise RuntimeError(
@@ -116,14 +219,12 @@ class BatchProcessor:
             )
 
         # Log partial failures
-        failed_results = [r for r in results if not r.success]
-        if failed_results:
-            for r in failed_results:
-                page_start, page_end = r.page_range
-                logger.warning(
-                    f"Batch {r.batch_index} (pages {page_start}-{page_end}) "
-                    f"failed: {r.error}"
-                )
+        for r in self.failed_batches:
+            page_start, page_end = r.page_range
+            logger.warning(
+                f"Batch {r.batch_index} (pages {page_start}-{page_end}) "
+                f"failed: {r.error}"
+            )
 
         # Merge and deduplicate results
         merged_clauses = self._merge_results(results, batches)
@@ -175,6 +276,26 @@ class BatchProcessor:
 
         return batches
 
+    def _get_reader(self, pdf_path: str) -> "PdfReader":
+        """Return the cached reader for a PDF, parsing it on first use.
+
+        Must be called with _reader_lock held.
+        """
+        cached = self._readers.get(pdf_path)
+        if cached is None:
+            from pypdf import PdfReader
+
+            pdf_file = open(pdf_path, "rb")
+            try:
+                reader = PdfReader(pdf_file)
+            except BaseException:
+                # Not tracked yet, so close() could not release it
+                pdf_file.close()
+                raise
+            cached = (pdf_file, reader)
+            self._readers[pdf_path] = cached
+        return cached[1]
+
     def _extract_page_range(
         self, pdf_path: str, start_page: int, end_page: int
     ) -> bytes:
@@ -188,19 +309,26 @@ class BatchProcessor:
         Returns:
             PDF bytes containing only the specified pages
         """
-        with open(pdf_path, "rb") as f:
-            reader = PdfReader(f)
+        from pypdf import PdfWriter
+
+        # The writer resolves page objects lazily from the reader's stream, so
+        # both copying and serialising must happen under the lock.
+        with self._reader_lock:
+            reader = self._get_reader(pdf_path)
             writer = PdfWriter()
 
-            # pypdf uses 0-indexed pages
-            for page_num in range(start_page - 1, end_page):
-                writer.add_page(reader.pages[page_num])
+            # Copy the range in one call (pypdf uses 0-indexed, end-exclusive
+            # ranges); the source outline is irrelevant to extraction
+            writer.append(
+                reader, pages=(start_page - 1, end_page), import_outline=False
+            )
 
-            # Write to bytes buffer
+            # Write to bytes buffer. getvalue() hands over the buffer's bytes
+            # without the extra copy seek(0) + read() makes; a memoryview
+            # would not help since the genai Blob model only accepts bytes.
             buffer = io.BytesIO()
             writer.write(buffer)
-            buffer.seek(0)
-            return buffer.read()
+            return buffer.getvalue()
 
     def _process_single_batch(
         self, pdf_path: str, batch_index: int, page_range: tuple[int, int]
@@ -215,64 +343,185 @@ class BatchProcessor:
         Returns:
             BatchResult with extracted clauses or error
         """
-        start_page, end_page = page_range
-        logger.info(f"Processing batch {batch_index}: pages {start_page}-{end_page}")
-
-        last_error: str | None = None
+        prepare = self._start_batch(pdf_path, batch_index, page_range)
+        last_error: Exception | None = None
 
         for attempt in range(self.config.max_retries):
             try:
-                # Extract page range to PDF bytes
-                pdf_bytes = self._extract_page_range(pdf_path, start_page, end_page)
-                logger.debug(f"Batch {batch_index}: extracted {len(pdf_bytes)} bytes")
-
-                # Build prompt with page context
-                prompt = self._build_batch_prompt(start_page, end_page)
-
-                # Call Gemini with PDF bytes
+                pdf_bytes, prompt = prepare()
                 result = self.client.extract_clauses_from_bytes(
-                    pdf_bytes, prompt, page_range=(start_page, end_page)
+                    pdf_bytes, prompt, page_range=page_range
                 )
+            except Exception as e:
+                last_error = e
+                delay = self._retry_delay(batch_index, attempt, e)
+                if delay is not None:
+                    time.sleep(delay)
+            else:
+                return self._batch_success(batch_index, page_range, result)
 
-                clauses = result.get("clauses", [])
+        return self._batch_failure(batch_index, page_range, last_error)
 
-                # Adjust page numbers from batch-relative to document-absolute
-                adjusted_clauses = self._adjust_page_numbers(
-                    clauses, start_page, end_page
-                )
+    async def _process_single_batch_async(
+        self, pdf_path: str, batch_index: int, page_range: tuple[int, int]
+    ) -> BatchResult:
+        """Async counterpart of _process_single_batch for the event-loop path.
 
-                logger.info(
-                    f"Batch {batch_index}: extracted {len(adjusted_clauses)} clauses"
-                )
+        Args:
+            pdf_path: Path to source PDF
+            batch_index: Index of this batch (for logging)
+            page_range: (start_page, end_page) tuple
 
-                return BatchResult(
-                    batch_index=batch_index,
-                    page_range=page_range,
-                    clauses=adjusted_clauses,
-                    success=True,
-                )
+        Returns:
+            BatchResult with extracted clauses or error
+        """
+        prepare = self._start_batch(pdf_path, batch_index, page_range)
+        last_error: Exception | None = None
 
-            except Exception as e:
-                last_error = str(e)
-                retries = self.config.max_retries
-                logger.warning(
-                    f"Batch {batch_index} attempt {attempt + 1}/{retries} failed: {e}"
+        for attempt in range(self.config.max_retries):
+            try:
+                pdf_bytes, prompt = prepare()
+                result = await self.client.aextract_clauses_from_bytes(
+                    pdf_bytes, prompt, page_range=page_range
                 )
+            except Exception as e:
+                last_error = e
+                delay = self._retry_delay(batch_index, attempt, e)
+                if delay is not None:
+                    await asyncio.sleep(delay)
+            else:
+                return self._batch_success(batch_index, page_range, result)
 
-                if attempt < self.config.max_retries - 1:
-                    delay = self.config.retry_delay * (2**attempt)
-                    logger.info(f"Retrying in {delay:.1f}s...")
-                    time.sleep(delay)
+        return self._batch_failure(batch_index, page_range, last_error)
+
+    def _start_batch(
+        self, pdf_path: str, batch_index: int, page_range: tuple[int, int]
+    ) -> Callable[[], tuple[bytes, str]]:
+        """Log the start of a batch and return its request preparer.
+
+        Pages and prompt do not change between attempts, so the preparer
+        extracts them on first use and returns the same pair to every retry.
+
+        Args:
+            pdf_path: Path to source PDF
+            batch_index: Index of this batch (for logging)
+            page_range: (start_page, end_page) tuple
+
+        Returns:
+            Memoized callable producing the (pdf_bytes, prompt) tuple
+        """
+        start_page, end_page = page_range
+        logger.info(f"Processing batch {batch_index}: pages {start_page}-{end_page}")
+        return functools.cache(
+            functools.partial(self._prepare_batch, pdf_path, batch_index, page_range)
+        )
+
+    def _prepare_batch(
+        self, pdf_path: str, batch_index: int, page_range: tuple[int, int]
+    ) -> tuple[bytes, str]:
+        """Extract a batch's pages and build its prompt.
+
+        Args:
+            pdf_path: Path to source PDF
+            batch_index: Index of this batch (for logging)
+            page_range: (start_page, end_page) tuple
+
+        Returns:
+            (pdf_bytes, prompt) tuple for the Gemini call
+        """
+        start_page, end_page = page_range
+
+        # Extract page range to PDF bytes
+        pdf_bytes = self._extract_page_range(pdf_path, start_page, end_page)
+        logger.debug(f"Batch {batch_index}: extracted {len(pdf_bytes)} bytes")
+
+        # Build prompt with page context
+        return pdf_bytes, self._build_batch_prompt(start_page, end_page)
+
+    def _batch_success(
+        self, batch_index: int, page_range: tuple[int, int], result: dict[str, Any]
+    ) -> BatchResult:
+        """Wrap a successful Gemini result in a BatchResult.
+
+        Args:
+            batch_index: Index of this batch (for logging)
+            page_range: (start_page, end_page) tuple
+            result: Parsed Gemini response with a "clauses" list
+
+        Returns:
+            Successful BatchResult with document-absolute page numbers
+        """
+        start_page, end_page = page_range
+        clauses = result.get("clauses", [])
+
+        # Adjust page numbers from batch-relative to document-absolute
+        adjusted_clauses = self._adjust_page_numbers(clauses, start_page, end_page)
+
+        logger.info(f"Batch {batch_index}: extracted {len(adjusted_clauses)} clauses")
+
+        return BatchResult(
+            batch_index=batch_index,
+            page_range=page_range,
+            clauses=adjusted_clauses,
+            success=True,
+        )
 
-        # All retries exhausted
+    def _batch_failure(
+        self,
+        batch_index: int,
+        page_range: tuple[int, int],
+        error: Exception | None,
+    ) -> BatchResult:
+        """Build the BatchResult for a batch whose retries are exhausted.
+
+        Args:
+            batch_index: Index of this batch
+            page_range: (start_page, end_page) tuple
+            error: Exception raised by the last attempt
+
+        Returns:
+            Failed BatchResult carrying the last error
+        """
         return BatchResult(
             batch_index=batch_index,
             page_range=page_range,
             clauses=[],
             success=False,
-            error=last_error,
+            error=str(error) if error is not None else None,
+        )
+
+    def _retry_delay(
+        self, batch_index: int, attempt: int, error: Exception
+    ) -> float | None:
+        """Log a failed attempt and return the backoff before the next one.
+
+        Args:
+            batch_index: Index of this batch (for logging)
+            attempt: Zero-based attempt number that failed
+            error: Exception raised by the attempt
+
+        Returns:
+            Seconds to wait, or None if no attempts remain
+        """
+        retries = self.config.max_retries
+        logger.warning(
+            f"Batch {batch_index} attempt {attempt + 1}/{retries} failed: {error}"
         )
 
+        if attempt >= retries - 1:
+            return None
+
+        # Capped exponential backoff with multiplicative jitter, so batches
+        # that failed together (e.g. on a 429) do not all retry in lockstep
+        delay = min(self.config.max_retry_delay, self.config.retry_delay * 2.0**attempt)
+        delay *= random.uniform(0.5, 1.0)
+        # An open circuit fails every call until its cool-down ends, so wait
+        # that out first; the jittered backoff on top spreads the batches
+        if isinstance(error, CircuitOpenError):
+            delay += error.retry_after
+        logger.info(f"Retrying in {delay:.1f}s...")
+        return delay
+
     def _build_batch_prompt(self, start_page: int, end_page: int) -> str:
         """Build prompt with page range context.
 
@@ -283,13 +532,7 @@ class BatchProcessor:
         Returns:
             Prompt string with page context
         """
-        page_context = (
-            f"\n\n**Page Context:** This is a subset of a larger document. "
-            f"The pages in this PDF correspond to pages {start_page}-{end_page} "
-            f"of the original document. Please report page numbers as they appear "
-            f"in the original document (starting from page {start_page})."
-        )
-        return CLAUSE_EXTRACTION_PROMPT + page_context
+        return _batch_prompt(start_page, end_page)
 
     def _adjust_page_numbers(
         self,
@@ -302,6 +545,9 @@ class BatchProcessor:
         The Gemini API receives a PDF subset starting from page 1, but we need
         page numbers relative to the original document.
 
+        The clause dicts are updated in place: they come from a freshly parsed
+        (or deep-copied cached) response that nothing else references.
+
         Args:
             clauses: List of clause dicts with 'page' field
             batch_start: First page of batch in original document
@@ -310,25 +556,20 @@ class BatchProcessor:
         Returns:
             Clauses with adjusted page numbers
         """
-        adjusted = []
         for clause in clauses:
-            new_clause = clause.copy()
-
             # The batch PDF starts at page 1, so page 1 in batch = batch_start in doc
             batch_page = clause.get("page", 1)
             doc_page = batch_start + batch_page - 1
 
             # Clamp to batch range
             doc_page = max(batch_start, min(batch_end, doc_page))
-            new_clause["page"] = doc_page
+            clause["page"] = doc_page
 
             # Mark source batch for deduplication
-            new_clause["_batch_start"] = batch_start
-            new_clause["_batch_end"] = batch_end
-
-            adjusted.append(new_clause)
+            clause["_batch_start"] = batch_start
+            clause["_batch_end"] = batch_end
 
-        return adjusted
+        return clauses
 
     def _process_sequential(
         self, pdf_path: str, batches: list[tuple[int, int]]
@@ -353,6 +594,9 @@ class BatchProcessor:
     ) -> list[BatchResult]:
         """Process batches in parallel.
 
+        Batches run as coroutines on a single event loop, so concurrency is
+        bounded by max_workers rather than by a thread pool.
+
         Args:
             pdf_path: Path to PDF file
             batches: List of (start_page, end_page) tuples
@@ -360,34 +604,53 @@ class BatchProcessor:
         Returns:
             List of BatchResult objects
         """
-        results: list[BatchResult] = []
+        return run_async(self._process_async(pdf_path, batches))
 
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            futures = {
-                executor.submit(
-                    self._process_single_batch, pdf_path, idx, page_range
-                ): idx
-                for idx, page_range in enumerate(batches)
-            }
-
-            for future in as_completed(futures):
-                batch_idx = futures[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Batch {batch_idx} raised exception: {e}")
-                    results.append(
-                        BatchResult(
-                            batch_index=batch_idx,
-                            page_range=batches[batch_idx],
-                            success=False,
-                            error=str(e),
-                        )
-                    )
+    async def _process_async(
+        self, pdf_path: str, batches: list[tuple[int, int]]
+    ) -> list[BatchResult]:
+        """Process batches concurrently, at most max_workers at a time.
+
+        Without the parallel option batches run one at a time. Launches are
+        staggered by launch_stagger seconds so the first wave of requests does
+        not hit page extraction and the API in lockstep.
 
-        # Sort by batch index to maintain order
-        results.sort(key=lambda r: r.batch_index)
+        Args:
+            pdf_path: Path to PDF file
+            batches: List of (start_page, end_page) tuples
+
+        Returns:
+            List of BatchResult objects in batch order
+        """
+        workers = self.config.max_workers if self.config.parallel else 1
+        semaphore = asyncio.Semaphore(workers)
+
+        async def _guarded(idx: int, page_range: tuple[int, int]) -> BatchResult:
+            if workers > 1:
+                await asyncio.sleep(self.config.launch_stagger * idx)
+            async with semaphore:
+                return await self._process_single_batch_async(pdf_path, idx, page_range)
+
+        outcomes = await asyncio.gather(
+            *(_guarded(idx, page_range) for idx, page_range in enumerate(batches)),
+            return_exceptions=True,
+        )
+
+        # gather preserves submission order, so results are already sorted
+        results: list[BatchResult] = []
+        for batch_idx, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Batch {batch_idx} raised exception: {outcome}")
+                results.append(
+                    BatchResult(
+                        batch_index=batch_idx,
+                        page_range=batches[batch_idx],
+                        success=False,
+                        error=str(outcome),
+                    )
+                )
+            else:
+                results.append(outcome)
         return results
 
     def _merge_results(
@@ -410,14 +673,18 @@ class BatchProcessor:
         Returns:
             Deduplicated and sorted list of clauses
         """
-        # Build overlap regions map
-        overlap_pages: set[int] = set()
-        for i in range(len(batches) - 1):
-            _, batch_end = batches[i]
-            next_start, _ = batches[i + 1]
-            # Pages in the overlap region
-            for page in range(next_start, batch_end + 1):
-                overlap_pages.add(page)
+        # Overlap regions as (first_page, last_page) intervals. Batches are in
+        # page order, so the interval starts are already sorted for bisect.
+        overlap_starts: list[int] = []
+        overlap_ends: list[int] = []
+        for (_, batch_end), (next_start, _) in zip(batches, batches[1:]):
+            if next_start <= batch_end:
+                overlap_starts.append(next_start)
+                overlap_ends.append(batch_end)
+
+        def in_overlap_region(page: int) -> bool:
+            i = bisect.bisect_right(overlap_starts, page) - 1
+            return i >= 0 and page <= overlap_ends[i]
 
         clause_map: dict[str, dict[str, Any]] = {}
 
@@ -432,7 +699,7 @@ class BatchProcessor:
 
                 page = clause.get("page", 0)
                 text = clause.get("text", "")
-                in_overlap = page in overlap_pages
+                in_overlap = in_overlap_region(page)
 
                 dedup_key = f"{page}:{clause_num}"
 
@@ -448,11 +715,12 @@ class BatchProcessor:
                 else:
                     clause_map[dedup_key] = clause
 
-        # Remove internal metadata and sort
-        final_clauses = []
-        for clause in clause_map.values():
-            clean_clause = {k: v for k, v in clause.items() if not k.startswith("_")}
-            final_clauses.append(clean_clause)
+        # Remove internal metadata (any "_"-prefixed key, not just the batch
+        # markers added here) and sort
+        final_clauses = [
+            {k: v for k, v in clause.items() if not k.startswith("_")}
+            for clause in clause_map.values()
+        ]
 
         # Sort by page, then by clause_number
         def sort_key(c: dict[str, Any]) -> tuple[int, str]:
@@ -1,16 +1,83 @@
-import base64
+import asyncio
+import copy
+import functools
+import hashlib
+import importlib.util
+import io
 import json
 import logging
 import os
+import random
 import re
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator, Sequence
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from langchain_core.messages import HumanMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
+# LangChain, google-genai and pypdf take over a second to import. They are
+# imported where first needed so that callers which only want constants or
+# validate_environment (e.g. CLI --help) do not pay for them.
+if TYPE_CHECKING:
+    from google.genai import Client
+    from google.genai.types import File
+    from langchain_core.messages import BaseMessage, HumanMessage
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
 logger = logging.getLogger(__name__)
 
+# orjson (the "speedups" extra) parses large structured responses several times
+# faster than the stdlib decoder; its JSONDecodeError subclasses the stdlib one.
+_json_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+_CODE_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+
+# Bounds on the candidates tried when locating the JSON object in unfenced
+# text, so stray braces and quoted keys cannot make the scan quadratic
+_MAX_KEY_ANCHORS = 8
+_MAX_BRACES_PER_ANCHOR = 8
+
+
+def _find_clauses_object(text: str) -> tuple[int, int, dict[str, Any]] | None:
+    """Locate and decode the JSON object holding the "clauses" key.
+
+    Returns:
+        (start, end, decoded object), or None if no candidate decodes
+    """
+    # Decode the object enclosing the "clauses" key rather than matching it
+    # with a regex, which backtracked quadratically on large unfenced
+    # responses. Candidates are tried from the nearest "{" before the key
+    # outwards. A preamble may quote the key itself, so later occurrences are
+    # tried too.
+    key = text.find('"clauses"')
+    for _ in range(_MAX_KEY_ANCHORS):
+        if key == -1:
+            break
+        start = text.rfind("{", 0, key)
+        for _ in range(_MAX_BRACES_PER_ANCHOR):
+            if start == -1:
+                break
+            try:
+                obj, end = _JSON_DECODER.raw_decode(text, start)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if isinstance(obj, dict) and "clauses" in obj:
+                    return start, end, obj
+            start = text.rfind("{", 0, start)
+        key = text.find('"clauses"', key + 1)
+    return None
+
 
 def extract_json_from_response(text: str) -> str:
     """Extract JSON object from response text.
@@ -20,23 +87,349 @@ def extract_json_from_response(text: str) -> str:
     - JSON wrapped in ```json ... ```
     - JSON with preamble text before it
     """
-    code_block_pattern = r"```(?:json)?\s*\n?(.*?)\n?```"
-    match = re.search(code_block_pattern, text, re.DOTALL)
+    match = _CODE_BLOCK_PATTERN.search(text)
     if match:
         return match.group(1).strip()
 
-    json_pattern = r'\{[^{}]*"clauses"\s*:\s*\[[\s\S]*\]\s*\}'
-    match = re.search(json_pattern, text)
-    if match:
-        return match.group(0)
+    found = _find_clauses_object(text)
+    if found is not None:
+        start, end, _ = found
+        return text[start:end]
 
     return text.strip()
 
 
+def _decode_response_json(text: str) -> Any:
+    """Decode the JSON object in a response, as extract_json_from_response finds it.
+
+    Raises:
+        json.JSONDecodeError: If no valid JSON can be extracted
+    """
+    match = _CODE_BLOCK_PATTERN.search(text)
+    if match:
+        return _json_loads(match.group(1).strip())
+
+    stripped = text.strip()
+    if stripped.startswith("{"):
+        # The common case: the whole response is the object
+        try:
+            return _json_loads(stripped)
+        except json.JSONDecodeError:
+            pass
+
+    # The object found here is already decoded; no need to parse it again
+    found = _find_clauses_object(text)
+    if found is not None:
+        return found[2]
+
+    return _json_loads(stripped)
+
+
 MAX_FILE_SIZE_MB = 100
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 
+# PDFs above this size are uploaded once through the Gemini Files API and
+# referenced by URI instead of being inlined (base64 in the JSON body) into
+# the request. Gemini rejects inline payloads above 20MB.
+FILE_API_THRESHOLD_MB = 20
+FILE_API_THRESHOLD_BYTES = FILE_API_THRESHOLD_MB * 1024 * 1024
+FILE_API_POLL_INTERVAL = 2.0
+
+# Retry policy for transient Gemini API failures. Delays grow exponentially
+# from RETRY_BASE_DELAY up to RETRY_MAX_DELAY, are stretched by up to
+# RETRY_JITTER so concurrent workers do not retry in lockstep, and never
+# undercut a delay advertised by the server.
+DEFAULT_MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_JITTER = 0.5
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+_RETRY_DELAY_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)s$")
+
+
+def _status_code(error: BaseException) -> int | None:
+    """Return the HTTP status carried by an API error, if any.
+
+    langchain-google-genai wraps 4xx errors in its own exception type, so the
+    chained cause is inspected as well.
+    """
+    for exc in (error, error.__cause__):
+        code = getattr(exc, "code", None)
+        if isinstance(code, int):
+            return code
+    return None
+
+
+@functools.cache
+def _transport_errors() -> tuple[type[BaseException], ...]:
+    """Exception types raised when a request fails in transport or server-side.
+
+    Resolved on first use, once an API call has already imported httpx and
+    google-genai.
+    """
+    import httpx
+    from google.genai.errors import ServerError
+
+    return (httpx.TransportError, ServerError, TimeoutError, ConnectionError)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Whether a failed request is worth retrying.
+
+    Transport failures (connection resets, timeouts), server errors and the
+    HTTP statuses in TRANSIENT_STATUS_CODES are. Anything else, such as an
+    error raised while building the request, is deterministic and would only
+    fail again.
+    """
+    transport_errors = _transport_errors()
+    if any(isinstance(exc, transport_errors) for exc in (error, error.__cause__)):
+        return True
+    return _status_code(error) in TRANSIENT_STATUS_CODES
+
+
+def _server_retry_delay(error: BaseException) -> float | None:
+    """Return the retry delay advertised by the server, in seconds.
+
+    Honours the ``retry-after-ms`` and ``retry-after`` headers, and the
+    ``RetryInfo.retryDelay`` detail Gemini attaches to 429 responses.
+    """
+    for exc in (error, error.__cause__):
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if headers is not None:
+            for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+                value = headers.get(name)
+                if value is None:
+                    continue
+                try:
+                    return float(value) * scale
+                except ValueError:
+                    pass  # HTTP-date form; fall back to our own backoff
+
+        details = getattr(exc, "details", None)
+        if isinstance(details, dict):
+            error_body = details.get("error", details)
+            for detail in error_body.get("details") or []:
+                retry_delay = detail.get("retryDelay", "")
+                match = _RETRY_DELAY_PATTERN.match(str(retry_delay))
+                if match:
+                    return float(match.group(1))
+    return None
+
+
+def _retry_delay(attempt: int, error: BaseException) -> float:
+    """Compute the jittered backoff delay before retry number ``attempt + 1``."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2.0**attempt)
+    delay *= 1 + random.uniform(0, RETRY_JITTER)
+    server_delay = _server_retry_delay(error)
+    if server_delay is not None:
+        delay = max(delay, server_delay)
+    return delay
+
+
+# Circuit breaker: after this many consecutive transient failures (across all
+# clients in the process) calls fail fast for the cool-down period instead of
+# each paying timeouts and backoff against an unavailable API. Only transport
+# failures and 5xx responses count: retried 4xx statuses (408, 429) concern
+# the request or the quota rather than an outage, and any other error is a
+# deterministic bug in the request.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN_SECONDS = 30.0
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the Gemini API while the circuit is open.
+
+    Attributes:
+        retry_after: Seconds until the circuit lets a request through again
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _CircuitBreaker:
+    """Process-wide consecutive-failure counter guarding the Gemini API."""
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_until = 0.0
+
+    def check(self) -> None:
+        """Raise CircuitOpenError while the cool-down period is running."""
+        with self._lock:
+            remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            raise self._open_error(remaining)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self, error: BaseException) -> None:
+        """Count an outage failure, raising CircuitOpenError if it opens.
+
+        Errors other than transport failures and 5xx responses are ignored.
+
+        Args:
+            error: The error the request failed with
+        """
+        code = _status_code(error)
+        if not _is_transient(error) or (code is not None and code < 500):
+            return
+        # The counter is not reset on opening, so once the cool-down ends a
+        # single further failure re-opens the circuit (half-open behaviour).
+        with self._lock:
+            self._failures += 1
+            if self._failures < self.threshold:
+                return
+            self._open_until = time.monotonic() + self.cooldown
+            failures = self._failures
+        logger.warning(
+            f"Opening Gemini circuit for {self.cooldown:.0f}s after "
+            f"{failures} consecutive failures"
+        )
+        raise self._open_error(self.cooldown) from error
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._open_until = 0.0
+
+    def _open_error(self, remaining: float) -> CircuitOpenError:
+        return CircuitOpenError(
+            f"Gemini API unavailable after {self.threshold} consecutive "
+            f"failures; failing fast for another {remaining:.0f}s",
+            retry_after=remaining,
+        )
+
+
+_circuit = _CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN_SECONDS)
+
+
+# Default number of in-flight requests for extract_clauses_many. The effective
+# ceiling is the requests-per-minute quota of the Gemini API tier in use.
+DEFAULT_CONCURRENCY = 8
+
+# Number of results GeminiClient keeps for identical (PDF, prompt) requests.
+RESULT_CACHE_SIZE = 128
+
+# Default quota for extract_clauses_batch; set these to your API tier's limits.
+DEFAULT_RPM = 60
+DEFAULT_TPM = 1_000_000
+
+# Gemini bills each PDF page as a fixed number of input tokens.
+TOKENS_PER_PDF_PAGE = 258
+RATE_WINDOW_SECONDS = 60.0
 
+
+def _estimate_tokens(pdf_path: str, prompt: str) -> int:
+    """Estimate the input tokens a PDF extraction request will consume."""
+    from pypdf import PdfReader
+
+    with open(pdf_path, "rb") as f:
+        page_count = len(PdfReader(f).pages)
+    return page_count * TOKENS_PER_PDF_PAGE + len(prompt) // 4
+
+
+_CLAUSES_ARRAY_PATTERN = re.compile(r'"clauses"\s*:\s*\[')
+
+
+def _content_text(content: str | list[str | dict[Any, Any]]) -> str:
+    """Flatten LangChain message content into plain text."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            str(block) if isinstance(block, str) else block.get("text", "")
+            for block in content
+        )
+    return str(content)
+
+
+class _ClauseStreamParser:
+    """Pull complete clause objects out of a JSON response as it streams in."""
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._in_array = False
+        self._decoder = json.JSONDecoder()
+        self.done = False
+
+    def feed(self, text: str) -> list[dict[str, Any]]:
+        """Add streamed text and return any clauses completed by it."""
+        self._buffer += text
+        if not self._in_array:
+            match = _CLAUSES_ARRAY_PATTERN.search(self._buffer)
+            if match is None:
+                return []
+            self._buffer = self._buffer[match.end() :]
+            self._in_array = True
+        elif "}" not in text and "]" not in text:
+            return []  # the pending clause cannot have closed yet
+
+        clauses: list[dict[str, Any]] = []
+        while not self.done:
+            self._buffer = self._buffer.lstrip(" \t\r\n,")
+            if not self._buffer:
+                break
+            if self._buffer[0] == "]":
+                self.done = True
+                break
+            try:
+                clause, end = self._decoder.raw_decode(self._buffer)
+            except json.JSONDecodeError:
+                break  # clause object not complete yet
+            clauses.append(clause)
+            self._buffer = self._buffer[end:]
+        return clauses
+
+
+class _RateLimiter:
+    """Rolling-window requests/minute and tokens/minute budget.
+
+    Not thread-safe: it is meant to be shared by tasks on one event loop.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests: deque[float] = deque()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._token_total = 0
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request of ``tokens`` fits in both budgets."""
+        while True:
+            now = time.monotonic()
+            cutoff = now - RATE_WINDOW_SECONDS
+            while self._requests and self._requests[0] <= cutoff:
+                self._requests.popleft()
+            while self._tokens and self._tokens[0][0] <= cutoff:
+                self._token_total -= self._tokens.popleft()[1]
+
+            # A request larger than the whole token budget is let through
+            # alone rather than blocking forever.
+            fits_tokens = not self._tokens or self._token_total + tokens <= self.tpm
+            if len(self._requests) < self.rpm and fits_tokens:
+                self._requests.append(now)
+                self._tokens.append((now, tokens))
+                self._token_total += tokens
+                return
+
+            oldest = min(
+                self._requests[0] if self._requests else now,
+                self._tokens[0][0] if self._tokens else now,
+            )
+            await asyncio.sleep(max(oldest - cutoff, 0.01))
+
+
+# Only a successful check is cached; a failure raises SystemExit instead.
+@functools.cache
 def validate_environment() -> None:
     if not os.getenv("GOOGLE_API_KEY"):
         print("ERROR: GOOGLE_API_KEY environment variable not set")
@@ -47,6 +440,60 @@ def validate_environment() -> None:
 DEFAULT_MODEL = "gemini-3-pro-preview"
 FLASH_MODEL = "gemini-3-flash-preview"
 
+# HTTP/2 multiplexes concurrent requests over one connection. httpx needs the
+# optional h2 package (the "speedups" extra) for it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Process-wide chat models keyed by their construction kwargs. Each model owns
+# a google-genai client and its HTTP connection pools, so sharing them lets
+# repeated GeminiClient instances reuse warm keep-alive connections instead of
+# paying a fresh TCP + TLS handshake per client. The async pool is bound to the
+# event loop that first used it, so code running inside a loop gets models of
+# its own; those of a closed loop are dropped on the next lookup.
+_shared_llms: dict[str, "ChatGoogleGenerativeAI"] = {}
+_loop_llms: dict[asyncio.AbstractEventLoop, dict[str, "ChatGoogleGenerativeAI"]] = {}
+_shared_llms_lock = threading.Lock()
+
+
+def _get_shared_llm(key: str, llm_kwargs: dict[str, Any]) -> "ChatGoogleGenerativeAI":
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    stale: list[ChatGoogleGenerativeAI] = []
+    with _shared_llms_lock:
+        if loop is None:
+            models = _shared_llms
+        else:
+            for closed in [lp for lp in _loop_llms if lp.is_closed()]:
+                stale.extend(_loop_llms.pop(closed).values())
+            models = _loop_llms.setdefault(loop, {})
+        llm = models.get(key)
+        if llm is None:
+            llm = ChatGoogleGenerativeAI(**llm_kwargs)
+            models[key] = llm
+
+    # The async pools of a closed loop cannot be closed any more; release
+    # what can be
+    for model in stale:
+        if model.client is not None:
+            model.client.close()
+    return llm
+
+
+@functools.lru_cache(maxsize=64)
+def _prompt_block(prompt: str) -> dict[str, str]:
+    """Return the shared text content block for a prompt.
+
+    The same prompt is sent with every retry and, in single-pass mode, with
+    every document, so the block is built once and reused by reference.
+    Callers must not mutate the returned dict.
+    """
+    return {"type": "text", "text": prompt}
+
 
 class GeminiClient:
     def __init__(
@@ -54,10 +501,14 @@ class GeminiClient:
         model: str = DEFAULT_MODEL,
         max_tokens: int = 32768,
         temperature: float = 0.1,
+        max_retries: int = DEFAULT_MAX_RETRIES,
     ):
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.max_retries = max_retries
+        self._result_cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
 
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key:
@@ -69,90 +520,103 @@ class GeminiClient:
             "max_output_tokens": max_tokens,
             "temperature": temperature,
             "api_key": api_key,
+            # Retries are handled by _call_llm; 1 (not 0) disables SDK retries
+            "max_retries": 1,
         }
         if "flash" not in model.lower():
             llm_kwargs["thinking_level"] = "low"
+        if HTTP2_AVAILABLE:
+            llm_kwargs["client_args"] = {"http2": True}
 
-        self.llm = ChatGoogleGenerativeAI(**llm_kwargs)
+        self._llm_kwargs = llm_kwargs
+        self._llm_key = repr(sorted(llm_kwargs.items()))
 
         logger.info(f"Initialized Gemini client with model: {model}")
 
-    def extract_clauses(self, pdf_path: str, prompt: str) -> dict[str, Any]:
-        pdf_file = Path(pdf_path)
+    @property
+    def llm(self) -> "ChatGoogleGenerativeAI":
+        """The shared chat model for the calling thread's event loop, if any."""
+        return _get_shared_llm(self._llm_key, self._llm_kwargs)
 
-        if not pdf_file.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    @classmethod
+    def reset_circuit(cls) -> None:
+        """Close the shared circuit breaker and clear its failure count."""
+        _circuit.reset()
 
-        file_size = pdf_file.stat().st_size
-        if file_size > MAX_FILE_SIZE_BYTES:
-            size_mb = file_size / (1024 * 1024)
-            raise ValueError(
-                f"PDF file too large: {size_mb:.1f}MB > {MAX_FILE_SIZE_MB}MB"
-            )
+    @classmethod
+    def close_shared_pool(cls) -> None:
+        """Close and forget the shared chat models used outside event loops.
 
-        logger.info(f"Loading PDF: {pdf_path} ({file_size / 1024:.1f} KB)")
+        Models bound to an event loop are closed by aclose_shared_pool, which
+        must run on that loop.
+        """
+        with _shared_llms_lock:
+            llms = list(_shared_llms.values())
+            _shared_llms.clear()
 
-        with open(pdf_file, "rb") as f:
-            pdf_bytes = f.read()
+        for llm in llms:
+            if llm.client is not None:
+                llm.client.close()
 
-        pdf_base64 = base64.b64encode(pdf_bytes).decode("utf-8")
+    @classmethod
+    async def aclose_shared_pool(cls) -> None:
+        """Close and forget the shared chat models bound to the running loop.
 
-        content: list[str | dict[Any, Any]] = [
-            {
-                "type": "file",
-                "source_type": "base64",
-                "mime_type": "application/pdf",
-                "data": pdf_base64,
-            },
-            {
-                "type": "text",
-                "text": prompt,
-            },
-        ]
+        Call this before the loop shuts down (e.g. at the end of the coroutine
+        passed to asyncio.run) so its HTTP connections are closed cleanly.
+        """
+        with _shared_llms_lock:
+            llms = list(_loop_llms.pop(asyncio.get_running_loop(), {}).values())
 
-        message = HumanMessage(content=content)
+        for llm in llms:
+            if llm.client is not None:
+                await llm.client.aio.aclose()
+                llm.client.close()
 
-        logger.info(f"Sending PDF to Gemini ({self.model})...")
+    def extract_clauses(self, pdf_path: str, prompt: str) -> dict[str, Any]:
+        return self._invoke(self._pdf_source(pdf_path), prompt, "")
 
-        response_text = ""
-        try:
-            response = self.llm.invoke([message])
-
-            if isinstance(response.content, str):
-                response_text = response.content
-            elif isinstance(response.content, list):
-                response_text = "".join(
-                    str(block) if isinstance(block, str) else block.get("text", "")
-                    for block in response.content
-                )
-            else:
-                response_text = str(response.content)
+    def extract_clauses_from_bytes(
+        self,
+        pdf_bytes: bytes,
+        prompt: str,
+        page_range: tuple[int, int] | None = None,
+    ) -> dict[str, Any]:
+        """Extract clauses from PDF bytes (for batch processing).
 
-            logger.info(f"Received response ({len(response_text)} chars)")
+        Args:
+            pdf_bytes: PDF file content as bytes
+            prompt: Extraction prompt to use
+            page_range: Optional (start, end) page tuple for logging
 
-            json_text = extract_json_from_response(response_text)
-            result = cast(dict[str, Any], json.loads(json_text))
+        Returns:
+            Dictionary containing extracted clauses
 
-            clause_count = len(result.get("clauses", []))
-            logger.info(f"Extracted {clause_count} clauses")
+        Raises:
+            ValueError: If response is not valid JSON
+        """
+        range_str = self._check_bytes(pdf_bytes, page_range)
+        return self._invoke(pdf_bytes, prompt, range_str)
 
-            return result
+    async def aextract_clauses(self, pdf_path: str, prompt: str) -> dict[str, Any]:
+        """Async variant of extract_clauses.
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Response text: {response_text[:500]}...")
-            raise ValueError(f"Invalid JSON in response: {e}") from e
-        except Exception as e:
-            logger.error(f"Error during Gemini API call: {e}")
-            raise
+        Args:
+            pdf_path: Path to the PDF file
+            prompt: Extraction prompt to use
 
-    def extract_clauses_from_bytes(
+        Returns:
+            Dictionary containing extracted clauses
+        """
+        return await self._ainvoke(self._pdf_source(pdf_path), prompt, "")
+
+    async def aextract_clauses_from_bytes(
         self,
         pdf_bytes: bytes,
         prompt: str,
         page_range: tuple[int, int] | None = None,
     ) -> dict[str, Any]:
-        """Extract clauses from PDF bytes (for batch processing).
+        """Async variant of extract_clauses_from_bytes.
 
         Args:
             pdf_bytes: PDF file content as bytes
@@ -161,66 +625,446 @@ class GeminiClient:
 
         Returns:
             Dictionary containing extracted clauses
+        """
+        range_str = self._check_bytes(pdf_bytes, page_range)
+        return await self._ainvoke(pdf_bytes, prompt, range_str)
+
+    async def extract_clauses_many(
+        self,
+        pdf_paths: Sequence[str],
+        prompt: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[dict[str, Any]]:
+        """Extract clauses from several PDFs with bounded concurrency.
+
+        Requests overlap on a single event loop, so wall time scales with
+        ``len(pdf_paths) / concurrency`` rather than with the number of PDFs.
+        Keep ``concurrency`` within the requests-per-minute quota of your
+        Gemini API tier.
+
+        Args:
+            pdf_paths: Paths to the PDF files
+            prompt: Extraction prompt to use for every PDF
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            One result dictionary per PDF, in the order of ``pdf_paths``
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _guarded(pdf_path: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.aextract_clauses(pdf_path, prompt)
+
+        return list(await asyncio.gather(*(_guarded(p) for p in pdf_paths)))
+
+    def stream_clauses(self, pdf_path: str, prompt: str) -> Iterator[dict[str, Any]]:
+        """Yield clauses as soon as each one is complete in the streamed response.
+
+        Downstream work can start on the first clause instead of waiting for
+        the last generated token. Streamed requests are not retried, since a
+        partially consumed stream cannot be replayed transparently.
+
+        Args:
+            pdf_path: Path to the PDF file
+            prompt: Extraction prompt to use
+
+        Yields:
+            Raw clause dictionaries in document order
 
         Raises:
-            ValueError: If response is not valid JSON
+            ValueError: If the stream ends before the clauses array is closed
         """
-        if len(pdf_bytes) > MAX_FILE_SIZE_BYTES:
+        pdf = self._pdf_source(pdf_path)
+        _circuit.check()
+
+        uploaded = self._upload_pdf(pdf) if self._needs_upload(pdf) else None
+        message = self._request_message(pdf, uploaded, prompt)
+
+        parser = _ClauseStreamParser()
+        clause_count = 0
+        try:
+            try:
+                for chunk in self.llm.stream([message]):
+                    for clause in parser.feed(_content_text(chunk.content)):
+                        clause_count += 1
+                        yield clause
+            except Exception as e:
+                if _is_transient(e):
+                    _circuit.record_failure(e)
+                raise
+            _circuit.record_success()
+        finally:
+            if uploaded is not None:
+                self._delete_upload(uploaded)
+
+        if not parser.done:
             raise ValueError(
-                f"PDF bytes too large: {len(pdf_bytes) / (1024*1024):.1f}MB "
-                f"> {MAX_FILE_SIZE_MB}MB"
+                f"Streamed response ended after {clause_count} clauses "
+                f"without closing the clauses array"
             )
+        logger.info(f"Streamed {clause_count} clauses")
 
-        range_str = f" (pages {page_range[0]}-{page_range[1]})" if page_range else ""
-        logger.info(f"Processing PDF bytes{range_str} ({len(pdf_bytes) / 1024:.1f} KB)")
+    def _invoke(self, pdf: bytes | Path, prompt: str, range_str: str) -> dict[str, Any]:
+        cache_key, cached = self._lookup(pdf, prompt, range_str)
+        if cached is not None:
+            return cached
 
-        pdf_base64 = base64.b64encode(pdf_bytes).decode("utf-8")
+        uploaded = self._upload_pdf(pdf) if self._needs_upload(pdf) else None
+        try:
+            response = self._call_llm(self._request_message(pdf, uploaded, prompt))
+        except Exception as e:
+            logger.error(f"Error during Gemini API call: {e}")
+            raise
+        finally:
+            if uploaded is not None:
+                self._delete_upload(uploaded)
 
-        content: list[str | dict[Any, Any]] = [
-            {
-                "type": "file",
-                "source_type": "base64",
-                "mime_type": "application/pdf",
-                "data": pdf_base64,
-            },
-            {
-                "type": "text",
-                "text": prompt,
-            },
-        ]
+        return self._store_response(cache_key, response, range_str)
+
+    async def extract_clauses_batch(
+        self,
+        pdf_paths: Sequence[str],
+        prompt: str,
+        rpm: int = DEFAULT_RPM,
+        tpm: int = DEFAULT_TPM,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Extract clauses from many PDFs within a requests/tokens quota.
 
-        message = HumanMessage(content=content)
+        Requests are launched as soon as the rolling 60-second budgets allow,
+        up to max_concurrency at a time, so the account quota is saturated
+        without provoking 429 storms. Input tokens are estimated from the page
+        count of each PDF.
 
-        logger.info(f"Sending PDF to Gemini ({self.model})...")
+        Args:
+            pdf_paths: Paths to the PDF files
+            prompt: Extraction prompt to use for every PDF
+            rpm: Requests per minute allowed by the API tier
+            tpm: Input tokens per minute allowed by the API tier
+            max_concurrency: Maximum number of in-flight requests
+
+        Yields:
+            (pdf_path, result) tuples in completion order
 
-        response_text = ""
+        Raises:
+            Exception: The first failure; remaining requests are cancelled
+        """
+        limiter = _RateLimiter(rpm, tpm)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(pdf_path: str) -> tuple[str, dict[str, Any]]:
+            async with semaphore:
+                # Counting pages with pypdf on the loop would block it
+                tokens = await asyncio.to_thread(_estimate_tokens, pdf_path, prompt)
+                await limiter.acquire(tokens)
+                pdf = self._pdf_source(pdf_path)
+                return pdf_path, await self._ainvoke(pdf, prompt, "")
+
+        tasks = [asyncio.create_task(_run(p)) for p in pdf_paths]
         try:
-            response = self.llm.invoke([message])
-
-            if isinstance(response.content, str):
-                response_text = response.content
-            elif isinstance(response.content, list):
-                response_text = "".join(
-                    str(block) if isinstance(block, str) else block.get("text", "")
-                    for block in response.content
-                )
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled requests unwind (and delete their uploads)
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _ainvoke(
+        self, pdf: bytes | Path, prompt: str, range_str: str
+    ) -> dict[str, Any]:
+        cache_key, cached = self._lookup(pdf, prompt, range_str)
+        if cached is not None:
+            return cached
+
+        # Uploads are rare (large PDFs only) and poll for minutes at most, so
+        # they reuse the sync Files API calls on a worker thread
+        uploaded = None
+        if self._needs_upload(pdf):
+            uploaded = await asyncio.to_thread(self._upload_pdf, pdf)
+        try:
+            message = self._request_message(pdf, uploaded, prompt)
+            response = await self._acall_llm(message)
+        except Exception as e:
+            logger.error(f"Error during Gemini API call: {e}")
+            raise
+        finally:
+            if uploaded is not None:
+                await asyncio.to_thread(self._delete_upload, uploaded)
+
+        return self._store_response(cache_key, response, range_str)
+
+    def _call_llm(self, message: "HumanMessage") -> "BaseMessage":
+        attempt = 0
+        while True:
+            _circuit.check()
+            try:
+                response = self.llm.invoke([message])
+            except Exception as e:
+                time.sleep(self._backoff(attempt, e))
+                attempt += 1
             else:
-                response_text = str(response.content)
+                _circuit.record_success()
+                return response
+
+    async def _acall_llm(self, message: "HumanMessage") -> "BaseMessage":
+        attempt = 0
+        while True:
+            _circuit.check()
+            try:
+                response = await self.llm.ainvoke([message])
+            except Exception as e:
+                await asyncio.sleep(self._backoff(attempt, e))
+                attempt += 1
+            else:
+                _circuit.record_success()
+                return response
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Record a failed call and return the delay before retrying it.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            error: Exception raised by the attempt
 
-            logger.info(f"Received response ({len(response_text)} chars)")
+        Returns:
+            Seconds to wait before the next attempt
 
-            json_text = extract_json_from_response(response_text)
-            result = cast(dict[str, Any], json.loads(json_text))
+        Raises:
+            Exception: ``error`` itself, if it is not worth retrying or no
+                retries remain
+        """
+        if not _is_transient(error):
+            raise error
+        _circuit.record_failure(error)
+        if attempt >= self.max_retries:
+            raise error
 
-            clause_count = len(result.get("clauses", []))
-            logger.info(f"Extracted {clause_count} clauses{range_str}")
+        delay = _retry_delay(attempt, error)
+        logger.warning(
+            f"Gemini request failed ({error}); "
+            f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+        )
+        return delay
 
-            return result
+    def _lookup(
+        self, pdf: bytes | Path, prompt: str, range_str: str
+    ) -> tuple[bytes, dict[str, Any] | None]:
+        """Return the result-cache key for a request and any cached result."""
+        cache_key = self._cache_key(pdf, prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing cached result for identical PDF{range_str}")
+        return cache_key, cached
 
+    def _request_message(
+        self, pdf: bytes | Path, uploaded: "File | None", prompt: str
+    ) -> "HumanMessage":
+        """Build the request, referencing the upload if the PDF was uploaded."""
+        logger.info(f"Sending PDF to Gemini ({self.model})...")
+        if uploaded is not None:
+            return self._build_message(uploaded, prompt)
+        return self._build_message(cast(bytes, pdf), prompt)
+
+    def _store_response(
+        self, cache_key: bytes, response: "BaseMessage", range_str: str
+    ) -> dict[str, Any]:
+        """Parse a response and cache the result.
+
+        Raises:
+            ValueError: If the response is not valid JSON
+        """
+        response_text = self._response_text(response)
+        try:
+            result = self._parse_response(response_text, range_str)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
             logger.error(f"Response text: {response_text[:500]}...")
             raise ValueError(f"Invalid JSON in response: {e}") from e
+
+        self._cache_put(cache_key, result)
+        return result
+
+    @staticmethod
+    def _cache_key(pdf: bytes | Path, prompt: str) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(pdf, Path):
+            with open(pdf, "rb") as f:
+                while chunk := f.read(1024 * 1024):
+                    digest.update(chunk)
+        else:
+            digest.update(pdf)
+        digest.update(prompt.encode())
+        return digest.digest()
+
+    def _cache_get(self, key: bytes) -> dict[str, Any] | None:
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def _cache_put(self, key: bytes, result: dict[str, Any]) -> None:
+        # Callers may mutate what they get back, so the cache keeps its own copy
+        result = copy.deepcopy(result)
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    @staticmethod
+    def _pdf_source(pdf_path: str) -> bytes | Path:
+        """Return the PDF's bytes, or its path if it will be uploaded from disk.
+
+        Files above the Files API threshold are streamed to the upload
+        straight from disk instead of being read into memory first.
+        """
+        pdf_file = GeminiClient._check_path(pdf_path)
+        if pdf_file.stat().st_size > FILE_API_THRESHOLD_BYTES:
+            return pdf_file
+        return pdf_file.read_bytes()
+
+    @staticmethod
+    def _check_path(pdf_path: str) -> Path:
+        pdf_file = Path(pdf_path)
+
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        file_size = pdf_file.stat().st_size
+        if file_size > MAX_FILE_SIZE_BYTES:
+            size_mb = file_size / (1024 * 1024)
+            raise ValueError(
+                f"PDF file too large: {size_mb:.1f}MB > {MAX_FILE_SIZE_MB}MB"
+            )
+
+        logger.info(f"Loading PDF: {pdf_path} ({file_size / 1024:.1f} KB)")
+        return pdf_file
+
+    @staticmethod
+    def _check_bytes(pdf_bytes: bytes, page_range: tuple[int, int] | None) -> str:
+        if len(pdf_bytes) > MAX_FILE_SIZE_BYTES:
+            raise ValueError(
+                f"PDF bytes too large: {len(pdf_bytes) / (1024*1024):.1f}MB "
+                f"> {MAX_FILE_SIZE_MB}MB"
+            )
+
+        range_str = f" (pages {page_range[0]}-{page_range[1]})" if page_range else ""
+        logger.info(f"Processing PDF bytes{range_str} ({len(pdf_bytes) / 1024:.1f} KB)")
+        return range_str
+
+    @staticmethod
+    def _needs_upload(pdf: bytes | Path) -> bool:
+        return isinstance(pdf, Path) or len(pdf) > FILE_API_THRESHOLD_BYTES
+
+    def _genai_client(self) -> "Client":
+        if self.llm.client is None:
+            raise RuntimeError("Gemini chat model has no initialised client")
+        return self.llm.client
+
+    def _upload_pdf(self, pdf: bytes | Path) -> "File":
+        files = self._genai_client().files
+        uploaded = files.upload(
+            file=self._upload_source(pdf), config={"mime_type": "application/pdf"}
+        )
+        while uploaded.state == "PROCESSING":
+            time.sleep(FILE_API_POLL_INTERVAL)
+            uploaded = files.get(name=cast(str, uploaded.name))
+        return self._check_upload(uploaded)
+
+    @staticmethod
+    def _upload_source(pdf: bytes | Path) -> io.BytesIO | Path:
+        if isinstance(pdf, Path):
+            size = pdf.stat().st_size
+            logger.info(f"Uploading {pdf} via Files API ({size / (1024*1024):.1f}MB)")
+            return pdf
+        logger.info(f"Uploading PDF via Files API ({len(pdf) / (1024*1024):.1f}MB)")
+        return io.BytesIO(pdf)
+
+    @staticmethod
+    def _check_upload(uploaded: "File") -> "File":
+        if uploaded.state != "ACTIVE" or not uploaded.uri:
+            raise RuntimeError(
+                f"Files API upload {uploaded.name} failed (state: {uploaded.state})"
+            )
+        logger.debug(f"Uploaded PDF available at {uploaded.uri}")
+        return uploaded
+
+    def _delete_upload(self, uploaded: "File") -> None:
+        # Uploads expire after 48 hours anyway, so cleanup is best-effort
+        try:
+            self._genai_client().files.delete(name=cast(str, uploaded.name))
         except Exception as e:
-            logger.error(f"Error during Gemini API call: {e}")
-            raise
+            logger.warning(f"Failed to delete uploaded file {uploaded.name}: {e}")
+
+    @staticmethod
+    def _build_message(pdf: "bytes | File", prompt: str) -> "HumanMessage":
+        from langchain_core.messages import HumanMessage
+
+        pdf_block: dict[str, Any]
+        if not isinstance(pdf, bytes):
+            pdf_block = {
+                "type": "media",
+                "mime_type": "application/pdf",
+                "file_uri": pdf.uri,
+            }
+        else:
+            # Raw bytes go straight into the request's inline_data blob; a
+            # base64 "file" block would only be decoded back to bytes.
+            pdf_block = {
+                "type": "media",
+                "mime_type": "application/pdf",
+                "data": pdf,
+            }
+
+        content: list[str | dict[Any, Any]] = [pdf_block, _prompt_block(prompt)]
+
+        return HumanMessage(content=content)
+
+    @staticmethod
+    def _response_text(response: "BaseMessage") -> str:
+        response_text = _content_text(response.content)
+        logger.info(f"Received response ({len(response_text)} chars)")
+        return response_text
+
+    @staticmethod
+    def _parse_response(response_text: str, range_str: str = "") -> dict[str, Any]:
+        result = cast(dict[str, Any], _decode_response_json(response_text))
+
+        clause_count = len(result.get("clauses", []))
+        logger.info(f"Extracted {clause_count} clauses{range_str}")
+
+        return result
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine in a fresh event loop, like asyncio.run.
+
+    The shared chat models bound to that loop are closed before it shuts
+    down, so their connections do not outlive it.
+
+    Raises:
+        RuntimeError: If called while an event loop is running in this
+            thread; await the coroutine there instead
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "Cannot start a new event loop from a running one; await the async "
+            "variant (e.g. main_async or BatchProcessor.process_async) instead"
+        )
+
+    async def _run() -> T:
+        try:
+            return await coro
+        finally:
+            await GeminiClient.aclose_shared_pool()
+
+    return asyncio.run(_run())
@@ -8,15 +8,25 @@ This module provides the main execution pipeline that:
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import logging
+import os
 import sys
+import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from src.batch_processor import BatchConfig, BatchProcessor
-from src.gemini_client import FLASH_MODEL, GeminiClient, validate_environment
-from src.models import transform_raw_to_output, validate_raw_response
+from src.gemini_client import (
+    DEFAULT_MODEL,
+    FLASH_MODEL,
+    GeminiClient,
+    _json_loads,
+    run_async,
+    validate_environment,
+)
 from src.prompts import CLAUSE_EXTRACTION_PROMPT
 
 # Configure logging
@@ -27,20 +37,142 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson (the "speedups" extra) encodes the output files several times faster
+# than the stdlib encoder, producing the same UTF-8 JSON.
+try:
+    import orjson
+
+    def _json_dumps(data: Any, indent: bool = True) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+
+except ImportError:
+
+    def _json_dumps(data: Any, indent: bool = True) -> bytes:
+        if indent:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+
+DEFAULT_CACHE_DIR = ".pdf_cache"
+
+
+def _cache_path(
+    cache_dir: str, pdf_file: Path, batch_config: BatchConfig | None
+) -> Path:
+    """Return the raw-response cache file for a PDF and extraction setup.
+
+    The key covers the PDF content, the prompt, the model and the batch
+    layout, so editing any of them misses the cache instead of returning a
+    stale result. Scheduling options (parallel, max_workers, retries) do not
+    change the extraction and are left out of the key.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(pdf_file, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    digest.update(CLAUSE_EXTRACTION_PROMPT.encode())
+    if batch_config is not None and batch_config.batch_size > 0:
+        setup: tuple[Any, ...] = (
+            batch_config.model,
+            batch_config.start_page,
+            batch_config.end_page,
+            batch_config.batch_size,
+            batch_config.overlap,
+        )
+    else:
+        setup = (DEFAULT_MODEL,)
+    digest.update(repr(setup).encode())
+    return Path(cache_dir) / f"{digest.hexdigest()}.raw.json"
+
+
+def _load_cached(cache_file: Path) -> dict[str, Any] | None:
+    """Return the cached raw response, or None on a cache miss.
+
+    An entry that cannot be decoded or fails validation is deleted and
+    treated as a miss, so a damaged file cannot fail every later run.
+    """
+    if not cache_file.exists():
+        return None
+
+    from src.models import validate_raw_response
+
+    try:
+        result = cast(dict[str, Any], _json_loads(cache_file.read_bytes()))
+        validate_raw_response(result)
+    except ValueError as e:
+        logger.warning(f"Discarding unusable cache entry {cache_file}: {e}")
+        cache_file.unlink(missing_ok=True)
+        return None
+    return result
+
+
+def _write_cache(cache_file: Path, data: bytes) -> None:
+    """Write a cache entry atomically.
+
+    The data goes to a temporary file in the cache directory that is renamed
+    into place, so an interrupted run never leaves a truncated entry behind.
+    """
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
 
 def main(
     pdf_path: str,
     output_path: str = "raw_response.json",
     final_output_path: str = "output.json",
     batch_config: BatchConfig | None = None,
+    cache_dir: str | None = DEFAULT_CACHE_DIR,
 ) -> dict[str, Any]:
     """Execute the complete clause extraction pipeline.
 
+    Synchronous entry point; see main_async for the pipeline itself. It runs
+    the pipeline in its own event loop, so code that already has a running
+    loop must await main_async instead.
+
     Args:
         pdf_path: Path to the PDF file to process
         output_path: Path for raw JSON response (default: raw_response.json)
         final_output_path: Path for final JSON output (default: output.json)
         batch_config: Optional batch configuration for large PDFs
+        cache_dir: Directory of cached raw responses; a hit skips the API
+            call entirely (None disables caching)
+
+    Returns:
+        Dictionary containing extracted clauses
+
+    Raises:
+        RuntimeError: If called while an event loop is running
+    """
+    return run_async(
+        main_async(pdf_path, output_path, final_output_path, batch_config, cache_dir)
+    )
+
+
+async def main_async(
+    pdf_path: str,
+    output_path: str = "raw_response.json",
+    final_output_path: str = "output.json",
+    batch_config: BatchConfig | None = None,
+    cache_dir: str | None = DEFAULT_CACHE_DIR,
+) -> dict[str, Any]:
+    """Execute the complete clause extraction pipeline on the running loop.
+
+    Args:
+        pdf_path: Path to the PDF file to process
+        output_path: Path for raw JSON response (default: raw_response.json)
+        final_output_path: Path for final JSON output (default: output.json)
+        batch_config: Optional batch configuration for large PDFs
+        cache_dir: Directory of cached raw responses; a hit skips the API
+            call entirely (None disables caching)
 
     Returns:
         Dictionary containing extracted clauses
@@ -70,21 +202,35 @@ def main(
     size_mb = size_kb / 1024
     logger.info(f"PDF file size: {size_kb:.1f} KB ({size_mb:.2f} MB)")
 
-    # Step 3: Extract clauses via Gemini API
-    logger.info("Step 3/5: Sending PDF to Gemini API...")
-
-    if batch_config is not None and batch_config.batch_size > 0:
+    # Step 3: Extract clauses via Gemini API (or reuse a cached response)
+    cache_file = _cache_path(cache_dir, pdf_file, batch_config) if cache_dir else None
+    # Only a complete response that passes step 5 is worth caching
+    cached = _load_cached(cache_file) if cache_file is not None else None
+    cacheable = cache_file is not None and cached is None
+
+    if cached is not None:
+        logger.info(f"Step 3/5: Reusing cached raw response {cache_file}")
+        result = cached
+    elif batch_config is not None and batch_config.batch_size > 0:
+        logger.info("Step 3/5: Sending PDF to Gemini API...")
         # Use batch processing for large PDFs
         logger.info(
             f"Using batch processing: batch_size={batch_config.batch_size}, "
             f"overlap={batch_config.overlap}, parallel={batch_config.parallel}"
         )
         processor = BatchProcessor(batch_config)
-        result = processor.process(pdf_path)
+        result = await processor.process_async(pdf_path)
+        if processor.failed_batches:
+            logger.warning(
+                f"{len(processor.failed_batches)} batch(es) failed; "
+                f"not caching the partial result"
+            )
+            cacheable = False
     else:
+        logger.info("Step 3/5: Sending PDF to Gemini API...")
         # Standard single-pass processing
         client = GeminiClient()
-        result = client.extract_clauses(pdf_path, CLAUSE_EXTRACTION_PROMPT)
+        result = await client.aextract_clauses(pdf_path, CLAUSE_EXTRACTION_PROMPT)
 
     # Log extraction summary
     clause_count = len(result.get("clauses", []))
@@ -92,26 +238,32 @@ def main(
 
     # Step 4: Save raw response for Phase 3 processing
     logger.info(f"Step 4/5: Saving raw response to {output_path}...")
-    output_file = Path(output_path)
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
-    raw_size_kb = output_file.stat().st_size / 1024
+    # The raw response is an intermediate artifact, so it is written compact;
+    # only the human-reviewed final output is indented
+    raw_bytes = _json_dumps(result, False)
+    Path(output_path).write_bytes(raw_bytes)
+    raw_size_kb = len(raw_bytes) / 1024
     logger.info(f"Raw response saved ({raw_size_kb:.2f} KB)")
 
     # Step 5: Transform raw response to final output format
     logger.info("Step 5/5: Transforming to final output format...")
-    validate_raw_response(result)
+    # Imported here so --help and early failures do not load pydantic
+    from src.models import dump_clauses, transform_raw_to_output
+
     clauses = transform_raw_to_output(result)
 
+    if cacheable and cache_file is not None:
+        _write_cache(cache_file, raw_bytes)
+        logger.debug(f"Cached raw response as {cache_file}")
+
     # Serialize to JSON
-    output_data = [clause.model_dump() for clause in clauses]
+    output_data = dump_clauses(clauses)
 
     # Write to final output file
-    final_output_file = Path(final_output_path)
-    with open(final_output_file, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    final_bytes = _json_dumps(output_data)
+    Path(final_output_path).write_bytes(final_bytes)
 
-    final_size_kb = final_output_file.stat().st_size / 1024
+    final_size_kb = len(final_bytes) / 1024
     logger.info(
         f"Final output saved to {final_output_path} "
         f"({len(clauses)} clauses, {final_size_kb:.2f} KB)"
@@ -130,6 +282,105 @@ def main(
     return result
 
 
+async def main_many(
+    pdf_paths: list[str],
+    output_path: str = "raw_response.json",
+    final_output_path: str = "output.json",
+    batch_config: BatchConfig | None = None,
+    cache_dir: str | None = DEFAULT_CACHE_DIR,
+    concurrency: int = 3,
+) -> int:
+    """Run the pipeline over several PDFs concurrently in one process.
+
+    Each PDF's outputs are written next to output_path/final_output_path with
+    the PDF's stem as a prefix (e.g. charter_output.json). A failing PDF is
+    logged and does not stop the others.
+
+    With parallel batching, each of the concurrent PDFs runs up to
+    batch_config.max_workers batches at once, so up to
+    concurrency * max_workers requests are in flight.
+
+    Args:
+        pdf_paths: Paths to the PDF files to process
+        output_path: Template path for raw JSON responses
+        final_output_path: Template path for final JSON outputs
+        batch_config: Optional batch configuration for large PDFs
+        cache_dir: Directory of cached raw responses (None disables caching)
+        concurrency: Maximum number of PDFs processed at once
+
+    Returns:
+        Process exit code: 0 if every PDF succeeded, else the highest
+        per-file exit code (see _report_error)
+
+    Raises:
+        ValueError: If two PDFs share a file stem, so their outputs would
+            overwrite each other
+    """
+    paths_by_stem: dict[str, list[str]] = {}
+    for pdf_path in pdf_paths:
+        paths_by_stem.setdefault(Path(pdf_path).stem, []).append(pdf_path)
+    clashes = [paths for paths in paths_by_stem.values() if len(paths) > 1]
+    if clashes:
+        raise ValueError(
+            "PDFs with the same file name would overwrite each other's outputs: "
+            + "; ".join(", ".join(paths) for paths in clashes)
+        )
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    def _prefixed(template: str, pdf_path: str) -> str:
+        template_path = Path(template)
+        stem = Path(pdf_path).stem
+        return str(template_path.with_name(f"{stem}_{template_path.name}"))
+
+    async def _run(pdf_path: str) -> None:
+        async with semaphore:
+            await main_async(
+                pdf_path,
+                _prefixed(output_path, pdf_path),
+                _prefixed(final_output_path, pdf_path),
+                batch_config,
+                cache_dir,
+            )
+
+    outcomes = await asyncio.gather(
+        *(_run(p) for p in pdf_paths), return_exceptions=True
+    )
+
+    exit_code = 0
+    for pdf_path, outcome in zip(pdf_paths, outcomes):
+        if isinstance(outcome, Exception):
+            exit_code = max(exit_code, _report_error(outcome, f"{pdf_path}: "))
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            logger.info(f"{pdf_path}: completed")
+
+    succeeded = sum(not isinstance(o, BaseException) for o in outcomes)
+    logger.info(f"Processed {succeeded}/{len(pdf_paths)} PDFs successfully")
+    return exit_code
+
+
+def _report_error(error: Exception, prefix: str = "") -> int:
+    """Log a pipeline failure and return the matching exit code.
+
+    Args:
+        error: Exception raised by the pipeline
+        prefix: Optional context (e.g. the PDF path) for the log message
+
+    Returns:
+        1 for file/validation errors, 2 for API errors
+    """
+    if isinstance(error, FileNotFoundError):
+        logger.error(f"{prefix}File not found: {error}")
+        return 1
+    if isinstance(error, ValueError):
+        logger.error(f"{prefix}Validation error: {error}")
+        return 1
+    logger.error(f"{prefix}API error: {error}")
+    return 2
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments.
 
@@ -144,6 +395,9 @@ Examples:
   # Basic (no batching)
   python -m src.main voyage-charter-example.pdf
 
+  # Several PDFs in one run (outputs are prefixed with each PDF's name)
+  python -m src.main charter1.pdf charter2.pdf --max-workers 2
+
   # With batching
   python -m src.main document.pdf --start-page 6 --end-page 39 --batch-size 10
 
@@ -162,10 +416,11 @@ Environment variables:
     )
 
     parser.add_argument(
-        "pdf_path",
-        nargs="?",
-        default="voyage-charter-example.pdf",
-        help="Path to the PDF file to process (default: voyage-charter-example.pdf)",
+        "pdf_paths",
+        nargs="*",
+        default=["voyage-charter-example.pdf"],
+        metavar="pdf_path",
+        help="PDF file(s) to process (default: voyage-charter-example.pdf)",
     )
 
     parser.add_argument(
@@ -181,6 +436,13 @@ Environment variables:
         help="Output path for final transformed JSON (default: output.json)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always call the API instead of reusing a cached raw response "
+        f"from {DEFAULT_CACHE_DIR}/",
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -229,7 +491,9 @@ Environment variables:
         "--max-workers",
         type=int,
         default=3,
-        help="Maximum parallel workers (default: 3)",
+        help="Maximum parallel workers, also the number of PDFs processed "
+        "at once; with several PDFs and --parallel, up to max_workers^2 "
+        "requests run concurrently (default: 3)",
     )
 
     batch_group.add_argument(
@@ -268,21 +532,34 @@ if __name__ == "__main__":
         )
 
     try:
-        main(args.pdf_path, args.output, args.final_output, batch_config)
-        sys.exit(0)
-
-    except FileNotFoundError as e:
-        logger.error(f"File not found: {e}")
-        sys.exit(1)
-
-    except ValueError as e:
-        logger.error(f"Validation error: {e}")
-        sys.exit(1)
+        cache_dir = None if args.no_cache else DEFAULT_CACHE_DIR
+        if len(args.pdf_paths) == 1:
+            main(
+                args.pdf_paths[0],
+                args.output,
+                args.final_output,
+                batch_config,
+                cache_dir,
+            )
+            sys.exit(0)
+
+        # Fail fast on a missing API key before fanning out
+        validate_environment()
+        exit_code = run_async(
+            main_many(
+                args.pdf_paths,
+                args.output,
+                args.final_output,
+                batch_config,
+                cache_dir,
+                concurrency=args.max_workers,
+            )
+        )
+        sys.exit(exit_code)
 
     except SystemExit:
         # Re-raise SystemExit (from validate_environment)
         raise
 
     except Exception as e:
-        logger.error(f"API error: {e}")
-        sys.exit(2)
+        sys.exit(_report_error(e))
@@ -2,14 +2,17 @@
 
 This module provides:
 - Clause model: Final output structure with id, title, text
+- iter_clause_rows: Lazily normalizes raw clauses into output rows
 - transform_raw_to_output: Converts raw API response to clean output format
+- dump_clauses: Serializes Clause objects to plain dicts for JSON output
 - validate_raw_response: Validates raw API response structure
 """
 
 import logging
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, cast
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +28,11 @@ class Clause(BaseModel):
     text: str = Field(description="Full clause text content")
 
 
+# Validates and dumps whole clause lists in a single pydantic-core call instead
+# of one Python-level model round trip per clause.
+_CLAUSE_LIST_ADAPTER = TypeAdapter(list[Clause])
+
+
 def validate_raw_response(raw_data: dict[str, Any]) -> None:
     """Validate that raw API response has expected structure.
 
@@ -60,31 +68,37 @@ def validate_raw_response(raw_data: dict[str, Any]) -> None:
     )
 
 
-def transform_raw_to_output(raw_data: dict[str, Any]) -> list[Clause]:
-    """Transform raw API response into final output format.
+def _clean_field(value: Any) -> str:
+    """Normalize a raw identifier/title value to a stripped string ("" if unset)."""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value) if value else ""
 
-    Takes the raw API response and converts it to clean output format.
+
+def iter_clause_rows(raw_clauses: list[dict[str, Any]]) -> Iterator[dict[str, str]]:
+    """Yield normalized {"id", "title", "text"} rows for raw clauses, lazily.
+
+    Consumers that only need the first clauses, or want to stream output,
+    can stop early without normalizing the rest.
 
     Args:
-        raw_data: Dict {"clauses": [{"clause_number": str, "title": str, "text": str}]}
+        raw_clauses: The "clauses" list of a validated raw response
 
-    Returns:
-        List of Clause objects in document order
+    Yields:
+        Row dicts in document order, ready for Clause validation
 
     Notes:
-        - Preserves document order (no sorting)
         - Handles duplicate IDs by appending _2, _3, etc.
         - Skips clauses with empty text
     """
-    clauses: list[Clause] = []
-    raw_clauses = raw_data.get("clauses", [])
     skipped_count = 0
     seen_ids: dict[str, int] = {}
-
-    logger.debug(f"Starting transformation of {len(raw_clauses)} raw clauses")
+    # Checked once so the per-clause debug f-strings are not built when the
+    # message would be discarded anyway
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     for idx, raw_clause in enumerate(raw_clauses):
-        text = raw_clause.get("text") or ""
+        text = raw_clause.get("text")
         text = text.strip() if isinstance(text, str) else ""
         if not text:
             clause_num = raw_clause.get("clause_number", "unknown")
@@ -92,35 +106,76 @@ def transform_raw_to_output(raw_data: dict[str, Any]) -> list[Clause]:
             skipped_count += 1
             continue
 
-        clause_id = raw_clause.get("clause_number") or ""
-        clause_id = clause_id.strip() if isinstance(clause_id, str) else str(clause_id)
+        clause_id = _clean_field(raw_clause.get("clause_number"))
         if not clause_id:
             logger.warning(f"Raw clause at index {idx} has no clause_number")
             clause_id = f"unknown_{idx}"
 
-        if clause_id in seen_ids:
-            seen_ids[clause_id] += 1
-            original_id = clause_id
-            clause_id = f"{clause_id}_{seen_ids[original_id]}"
-            logger.debug(f"Duplicate ID '{original_id}' renamed to '{clause_id}'")
-        else:
-            seen_ids[clause_id] = 1
+        count = seen_ids.get(clause_id, 0) + 1
+        seen_ids[clause_id] = count
+        if count > 1:
+            if debug:
+                logger.debug(
+                    f"Duplicate ID '{clause_id}' renamed to '{clause_id}_{count}'"
+                )
+            clause_id = f"{clause_id}_{count}"
 
-        title = raw_clause.get("title") or ""
-        title = title.strip() if isinstance(title, str) else str(title)
+        title = _clean_field(raw_clause.get("title"))
         if not title:
             title = clause_id
 
-        logger.debug(f"Clause {clause_id}: title='{title[:50]}', text_len={len(text)}")
+        if debug:
+            logger.debug(
+                f"Clause {clause_id}: title='{title[:50]}', text_len={len(text)}"
+            )
 
-        clause = Clause(id=clause_id, title=title, text=text)
-        clauses.append(clause)
+        yield {"id": clause_id, "title": title, "text": text}
 
     if skipped_count > 0:
         logger.info(f"Skipped {skipped_count} clauses with empty text")
 
+
+def transform_raw_to_output(raw_data: dict[str, Any]) -> list[Clause]:
+    """Transform raw API response into final output format.
+
+    Takes the raw API response and converts it to clean output format.
+
+    Args:
+        raw_data: Dict {"clauses": [{"clause_number": str, "title": str, "text": str}]}
+
+    Returns:
+        List of Clause objects in document order
+
+    Raises:
+        ValueError: If raw_data fails validate_raw_response's structure checks
+
+    Notes:
+        - Preserves document order (no sorting)
+        - Handles duplicate IDs by appending _2, _3, etc.
+        - Skips clauses with empty text
+    """
+    validate_raw_response(raw_data)
+
+    raw_clauses = raw_data["clauses"]
+    logger.debug(f"Starting transformation of {len(raw_clauses)} raw clauses")
+
+    # Rows are validated in one batch; per-clause Clause() construction is slower
+    clauses = _CLAUSE_LIST_ADAPTER.validate_python(list(iter_clause_rows(raw_clauses)))
+
     if len(clauses) < 10:
         logger.warning(f"Only {len(clauses)} clauses extracted - may indicate failure")
 
     logger.info(f"Transformed {len(clauses)} clauses to output format (document order)")
     return clauses
+
+
+def dump_clauses(clauses: list[Clause]) -> list[dict[str, Any]]:
+    """Serialize clauses to plain dicts for JSON output.
+
+    Args:
+        clauses: Clause objects from transform_raw_to_output
+
+    Returns:
+        List of {"id", "title", "text"} dicts in the same order
+    """
+    return cast(list[dict[str, Any]], _CLAUSE_LIST_ADAPTER.dump_python(clauses))
@@ -0,0 +1,77 @@
+"""Tests for the Gemini client's retry and circuit-breaker handling."""
+
+import os
+import unittest
+from unittest import mock
+
+from google.genai.errors import ServerError
+
+from src import gemini_client
+from src.gemini_client import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    DEFAULT_MAX_RETRIES,
+    CircuitOpenError,
+    GeminiClient,
+    extract_json_from_response,
+)
+
+
+class ExtractJsonTest(unittest.TestCase):
+    def test_preamble_quoting_the_key(self) -> None:
+        text = 'Below are the "clauses": {"clauses": [{"a": 1}]} Done.'
+
+        self.assertEqual(extract_json_from_response(text), '{"clauses": [{"a": 1}]}')
+        self.assertEqual(GeminiClient._parse_response(text), {"clauses": [{"a": 1}]})
+
+    def test_many_braces_and_keys_stay_fast(self) -> None:
+        text = "{ " * 5000 + '"clauses" ' * 2000
+
+        # Nothing decodes; the bounded scan gives up quickly
+        self.assertEqual(extract_json_from_response(text), text.strip())
+
+
+class CallRetryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        GeminiClient.reset_circuit()
+        self.addCleanup(GeminiClient.reset_circuit)
+        env = mock.patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key"})
+        env.start()
+        self.addCleanup(env.stop)
+        sleep = mock.patch.object(gemini_client.time, "sleep")
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def _client(self, error: Exception) -> tuple[GeminiClient, mock.Mock]:
+        llm = mock.Mock()
+        llm.invoke.side_effect = error
+        patcher = mock.patch.object(GeminiClient, "llm", new=llm)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return GeminiClient(), llm
+
+    def test_value_error_is_not_retried_and_does_not_trip_circuit(self) -> None:
+        client, llm = self._client(ValueError("Unrecognized message part type"))
+
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD + 1):
+            with self.assertRaises(ValueError):
+                client._call_llm(mock.sentinel.message)
+
+        self.assertEqual(llm.invoke.call_count, CIRCUIT_FAILURE_THRESHOLD + 1)
+        self.sleep.assert_not_called()
+        gemini_client._circuit.check()  # still closed
+
+    def test_server_error_is_retried_and_opens_circuit(self) -> None:
+        client, llm = self._client(ServerError(503, {}))
+
+        with self.assertRaises(ServerError):
+            client._call_llm(mock.sentinel.message)
+        self.assertEqual(llm.invoke.call_count, DEFAULT_MAX_RETRIES + 1)
+
+        with self.assertRaises(CircuitOpenError):
+            client._call_llm(mock.sentinel.message)
+        with self.assertRaises(CircuitOpenError):
+            gemini_client._circuit.check()
+
+
+if __name__ == "__main__":
+    unittest.main()